@@ -3,8 +3,100 @@
 # This software is released under the MIT License
 # https://opensource.org/licenses/MIT
 
-from typing import Dict, Any, Iterator, Union
-import re, inspect
+from typing import Dict, Any, Callable, Iterator, List, Optional, Set, Tuple, Union
+from types import FunctionType
+import copy, re, inspect, sys
+
+_SANITIZE_RE = re.compile(r'\W+')
+_SANITIZE_SUB = _SANITIZE_RE.sub
+# Unbound, so a non-str key raises TypeError (like re.sub) instead of AttributeError.
+_IS_ASCII = str.isascii
+_IS_IDENTIFIER = str.isidentifier
+_RESERVED = frozenset(('_dict', '_dict_types', '_strict_subtraction', '_strict_typing', '_bind_self'))
+
+def _as_dict(x: Union[Dict[str, Any],'Dynamic']) -> Dict[str, Any]:
+    return x if isinstance(x, dict) else x._dict
+
+def _types_of(d: Dict[str, Any]) -> Dict[str, type]:
+    return {name: Dynamic if isinstance(value, dict) else type(value) for name, value in d.items() if value is not None}
+
+def _shallow_copy(dyn: 'Dynamic') -> 'Dynamic':
+    new = Dynamic.__new__(Dynamic)
+    object.__setattr__(new, '_dict', dyn._dict.copy())
+    object.__setattr__(new, '_dict_types', dyn._dict_types.copy())
+    object.__setattr__(new, '_strict_subtraction', dyn._strict_subtraction)
+    object.__setattr__(new, '_strict_typing', dyn._strict_typing)
+    return new
+
+def _merge_items(dyn: 'Dynamic', items: Dict[str, Any]) -> None:
+    if not dyn._strict_typing:
+        # Nothing to type check, so let dict.update insert (and size the table) once the keys are renamed,
+        # then swap in the wrapped nested dicts. They are wrapped up front so a failure leaves dyn unchanged.
+        if not all(_IS_ASCII(name) and _IS_IDENTIFIER(name) for name in items):
+            items = {name if _IS_ASCII(name) and _IS_IDENTIFIER(name) else sys.intern(_SANITIZE_SUB('_', name)): value for name, value in items.items()}
+        if _RESERVED.isdisjoint(items):
+            nested = {name: _from_dict(value) for name, value in items.items() if isinstance(value, dict)}
+            d = dyn._dict
+            d.update(items)
+            if nested:
+                d.update(nested)
+            return
+    d = dyn._dict
+    types = dyn._dict_types
+    strict = dyn._strict_typing
+    for name, value in items.items():
+        if not (_IS_ASCII(name) and _IS_IDENTIFIER(name)):
+            name = sys.intern(_SANITIZE_SUB('_', name))
+        if name in _RESERVED:
+            dyn.__setattr__(name, value)
+            # Internal attributes may have been swapped out from under the locals above.
+            d = dyn._dict
+            types = dyn._dict_types
+            strict = dyn._strict_typing
+            continue
+        if isinstance(value, dict):
+            value = _from_dict(value)
+            value_type = Dynamic
+        else:
+            value_type = type(value)
+        if strict and value is not None and name in d and value_type is not types[name]:
+            raise TypeError(f"'dynamic' with '_strict_typing' enabled prohibits setting {name}:{types[name]} to type {value_type}. ")
+        d[name] = value
+        if strict and value is not None:
+            types[name] = value_type
+
+def _from_dict(source: Dict[str, Any]) -> 'Dynamic':
+    # Builds nested dicts with an explicit stack so deep nesting doesn't recurse once per level.
+    root = Dynamic.__new__(Dynamic)
+    stack: List[Tuple[Optional['Dynamic'], Dict[str, Any]]] = [(root, source)]
+    path: Set[int] = set()
+    while stack:
+        target, src = stack.pop()
+        if target is None:
+            path.remove(id(src))
+            continue
+        path.add(id(src))
+        stack.append((None, src))
+        object.__setattr__(target, '_strict_subtraction', True)
+        object.__setattr__(target, '_strict_typing', False)
+        object.__setattr__(target, '_dict', {})
+        object.__setattr__(target, '_dict_types', {})
+        for name, value in src.items():
+            if not (_IS_ASCII(name) and _IS_IDENTIFIER(name)):
+                name = sys.intern(_SANITIZE_SUB('_', name))
+            if name in _RESERVED:
+                target.__setattr__(name, value)
+                continue
+            if isinstance(value, dict):
+                if id(value) in path:
+                    raise ValueError("'dynamic' cannot wrap a dict that contains itself")
+                child = Dynamic.__new__(Dynamic)
+                stack.append((child, value))
+                value = child
+            target._dict[name] = value
+        if target._strict_typing:
+            object.__setattr__(target, '_dict_types', _types_of(target._dict))
+    return root
 
 class Dynamic:
     """A dictionary wrapper that allows attribute access and mutation using both dot notation and dictionary-style indexing.
@@ -60,6 +152,7 @@ class Dynamic:
     - Arithmetic Operations -- Use addition `+`/`+=` or subtraction `-`/`-=` operations for set-like operations to add or remove attributes.
         - Strict Substraction: By default, subtraction only removes matching keys and values. This can be changed to just check keys. See `_strict_subtraction` parameter above for details.
     - String Representation -- Casting to a string returns the string representation of the internal dictionary.
+    - Copying -- `copy.copy` returns a shallow copy that keeps the `_strict_subtraction`/`_strict_typing` settings. Nested dynamics are shared with the original; use `copy.deepcopy` to copy them too.
     - Attribute Deletion -- Allows for the deletion of attributes using the `del` keyword. This also works for nested keys.
     - Equality Comparison -- Supports equality checks with both dictionaries and other dynamic objects.
     - Boolean Context -- Evaluates to `False` if the internal dictionary is empty.
@@ -117,6 +210,12 @@ class Dynamic:
 
     Check out the unit tests for even more thorough usage examples.
     """
+    __slots__ = ('_dict', '_dict_types', '_strict_subtraction', '_strict_typing', '__weakref__')
+    _dict: Dict[str, Any]
+    _dict_types: Dict[str, type]
+    _strict_subtraction: bool
+    _strict_typing: bool
+
     def __init__(self,
                 _dict: Union[Dict[str, Any],'Dynamic',None] = None,
                 _strict_subtraction: bool = True,
@@ -124,72 +223,92 @@ class Dynamic:
             ) -> None:
         if _dict is not None and not isinstance(_dict, (dict,Dynamic)):
             raise TypeError("'dynamic' _dict argument must be a dict or dynamic")
-        if _strict_subtraction is not None and not isinstance(_strict_subtraction, bool):
+        if not isinstance(_strict_subtraction, bool):
             raise TypeError("'dynamic' _strict_subtraction argument must be a bool")
-        if _strict_typing is not None and not isinstance(_strict_typing, bool):
+        if not isinstance(_strict_typing, bool):
             raise TypeError("'dynamic' _strict_typing argument must be a bool")
-        self._strict_subtraction = _strict_subtraction
-        self._strict_typing = _strict_typing
-        self._dict = {}
-        self._dict_types = {}
-        self += _dict or {}
+        object.__setattr__(self, '_strict_subtraction', _strict_subtraction)
+        object.__setattr__(self, '_strict_typing', _strict_typing)
+        object.__setattr__(self, '_dict', {})
+        object.__setattr__(self, '_dict_types', {})
+        if _dict:
+            self += _dict
 
     def __setattr__(self, name: str, value: Any) -> None:
-        name = re.sub(r'\W+', '_', name)
-        if name in ('_bind_self',):
+        if not (_IS_ASCII(name) and _IS_IDENTIFIER(name)):
+            name = sys.intern(_SANITIZE_SUB('_', name))
+        if name in _RESERVED:
+            if name == '_dict' or name == '_dict_types':
+                if isinstance(value, dict):
+                    super().__setattr__(name, value)
+                    return
+                raise TypeError("'dynamic' _dict attribute must be a dict")
+            if name == '_strict_subtraction' or name == '_strict_typing':
+                if isinstance(value, bool):
+                    if name == '_strict_typing' and value and not self._strict_typing:
+                        # Types are only tracked while strict typing is on, so catch up on everything stored so far.
+                        super().__setattr__('_dict_types', _types_of(self._dict))
+                    super().__setattr__(name, value)
+                    return
+                raise TypeError(f"'dynamic' {name} attribute must be a bool")
             raise ValueError(f"'dynamic' {name} attribute should not be modified!")
-        elif name in ('_dict','_dict_types'):
-            if isinstance(value, dict):
-                super().__setattr__(name, value)
-                return
-            raise TypeError("'dynamic' _dict attribute must be a dict")
-        elif name in ('_strict_subtraction','_strict_typing'):
-            if isinstance(value, bool):
-                super().__setattr__(name, value)
-                return
-            raise TypeError(f"'dynamic' {name} attribute must be a bool")
+        is_dict = isinstance(value, dict)
         if self._strict_typing and value is not None and name in self:
-            target_type = Dynamic if isinstance(value, (dict,Dynamic)) else type(value)
-            if target_type != self._dict_types[name]:
+            target_type = Dynamic if is_dict else type(value)
+            if target_type is not self._dict_types[name]:
                 raise TypeError(f"'dynamic' with '_strict_typing' enabled prohibits setting {name}:{self._dict_types[name]} to type {target_type}. ")
-        self._dict[name] = Dynamic(value) if isinstance(value, dict) else value
-        if value != None:
-            self._dict_types[name] = Dynamic if isinstance(value, dict) else type(value)
+        self._dict[name] = _from_dict(value) if is_dict else value
+        if self._strict_typing and value is not None:
+            self._dict_types[name] = Dynamic if is_dict else type(value)
 
     def __iadd__(self, other: Any) -> 'Dynamic':
         if isinstance(other, (Dynamic, dict)):
-            for key, value in other.items() if isinstance(other, dict) else other._dict.items():
-                self.__setattr__(key, value)
+            _merge_items(self, _as_dict(other))
             return self
         raise TypeError(f"Unsupported operand type(s) for +, +=: 'dynamic' and '{type(other).__name__}'. ")
 
+    def __copy__(self) -> 'Dynamic':
+        return _shallow_copy(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Dynamic':
+        new = Dynamic.__new__(Dynamic)
+        memo[id(self)] = new
+        object.__setattr__(new, '_dict', copy.deepcopy(self._dict, memo))
+        object.__setattr__(new, '_dict_types', self._dict_types.copy())
+        object.__setattr__(new, '_strict_subtraction', self._strict_subtraction)
+        object.__setattr__(new, '_strict_typing', self._strict_typing)
+        return new
+
     def __add__(self, other: Any) -> 'Dynamic':
-        new = Dynamic(self, self._strict_subtraction, self._strict_typing)
+        if isinstance(other, (Dynamic, dict)):
+            if not other:
+                return _shallow_copy(self)
+            if not self._dict:
+                return Dynamic(other, self._strict_subtraction, self._strict_typing)
+        new = _shallow_copy(self)
         new += other
         return new
 
     def __isub__(self, other: Any) -> 'Dynamic':
         if isinstance(other, (Dynamic, dict)):
+            d = self._dict
             if self._strict_subtraction:
-                for key, value in other.items() if isinstance(other, dict) else other._dict.items():
-                    if (self._dict.get(key) == value):
-                        del self._dict[key]
+                for key, value in _as_dict(other).items():
+                    if (d.get(key) == value):
+                        del d[key]
             else:
-                for key in other.keys():
-                    try:
-                        del self._dict[key]
-                    except:
-                        pass
+                for key in _as_dict(other):
+                    d.pop(key, None)
             return self
         raise TypeError(f"Unsupported operand type(s) for -, -=: 'dynamic' and '{type(other).__name__}'. ")
 
     def __sub__(self, other: Any) -> 'Dynamic':
-        new = Dynamic(self, self._strict_subtraction, self._strict_typing)
+        new = _shallow_copy(self)
         new -= other
         return new
 
-    def _bind_self(self, func):
-        def wrapper(*args, **kwargs):
+    def _bind_self(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 sig = inspect.signature(func)
                 first_param = next(iter(sig.parameters.keys()))
@@ -201,18 +320,19 @@ class Dynamic:
         return wrapper
 
     def __getattr__(self, name: str) -> Any:
-        if name in self._dict:
+        try:
             attr = self._dict[name]
-            if inspect.isfunction(attr):
-                attr = self._bind_self(attr)
-            return attr
-        raise AttributeError(f"'dynamic' object has no attribute '{name}'")
+        except KeyError:
+            raise AttributeError(f"'dynamic' object has no attribute '{name}'") from None
+        if isinstance(attr, FunctionType):
+            attr = self._bind_self(attr)
+        return attr
 
     def __getitem__(self, key: str) -> Any:
-        try:
-            return self.__getattr__(key)
-        except AttributeError:
-            raise KeyError(key)
+        attr = self._dict[key]
+        if isinstance(attr, FunctionType):
+            attr = self._bind_self(attr)
+        return attr
 
     def __delattr__(self, name: str) -> None:
         if name in self._dict:
@@ -229,12 +349,14 @@ class Dynamic:
     def __contains__(self, key: str) -> bool:
         return key in self._dict
 
-    def __eq__(self, other: Any) -> bool:
-        if isinstance(other, dict):
+    def __eq__(self, other: object) -> bool:
+        if type(other) is dict:
             return self._dict == other
-        if isinstance(other, Dynamic):
+        if type(other) is Dynamic:
             return self._dict == other._dict
-        return False
+        if isinstance(other, (dict, Dynamic)):
+            return self._dict == _as_dict(other)
+        return NotImplemented
 
     def __bool__(self) -> bool:
         return bool(self._dict)
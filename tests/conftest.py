@@ -0,0 +1,17 @@
+# Copyright (c) 2024 Shane Plesner
+#
+# This software is released under the MIT License
+# https://opensource.org/licenses/MIT
+
+import pytest
+from types import MappingProxyType
+
+from DynamicDict import Dynamic
+
+@pytest.fixture(scope="session")
+def proto_twokeys():
+    return MappingProxyType({'key1': 'value1', 'key2': 'value2'})
+
+@pytest.fixture
+def mutable_dd(proto_twokeys):
+    return Dynamic(dict(proto_twokeys))
@@ -3,10 +3,18 @@
 # This software is released under the MIT License
 # https://opensource.org/licenses/MIT
 
+import copy
+import weakref
 import pytest
 
 from DynamicDict import Dynamic
 
+_BASE = Dynamic({'key1': 'value1'})
+
+@pytest.fixture
+def dd():
+    return copy.copy(_BASE)
+
 def test_init_with_dict():
     d = {'key1': 'value1', 'key2': {'subkey1': 'subvalue1'}}
     dd = Dynamic(d)
@@ -15,10 +23,18 @@ def test_init_with_dict():
     assert isinstance(dd.key2, Dynamic)
     assert dd.key2.subkey1 == 'subvalue1'
 
-def test_init_with_invalid():
-    s = 'string1'
-    with pytest.raises(TypeError):
-        dd = Dynamic(s)
+@pytest.mark.parametrize("op,exc", [
+    pytest.param(lambda: Dynamic('string1'), TypeError, id='init_with_invalid'),
+    pytest.param(lambda: setattr(Dynamic(), '_dict', 'not a dict'), TypeError, id='setattr_dict_type_error'),
+    pytest.param(lambda: Dynamic().__iadd__(123), TypeError, id='iadd_type_error'),
+    pytest.param(lambda: Dynamic().__iadd__('string1'), TypeError, id='use_inspection_disabled'),
+    pytest.param(lambda: Dynamic({1: 'value1'}), TypeError, id='non_str_key'),
+    pytest.param(lambda: Dynamic({'key': 'value'}, _strict_typing = True).__iadd__({1: 'value1'}), TypeError, id='non_str_key_strict'),
+    pytest.param(lambda: Dynamic({'key': {1: 'value1'}}), TypeError, id='non_str_nested_key'),
+])
+def test_raises(op, exc):
+    with pytest.raises(exc):
+        op()
 
 def test_nested_dicts():
     d = {'level1': {'level2': {'level3': 'value3'}}}
@@ -27,6 +43,41 @@ def test_nested_dicts():
     assert isinstance(dd.level1.level2, Dynamic)
     assert dd.level1.level2.level3 == 'value3'
 
+def test_deeply_nested_dicts():
+    d = {}
+    inner = d
+    for _ in range(5000):
+        inner['level'] = {}
+        inner = inner['level']
+    inner['key'] = 'value'
+    dd = Dynamic(d)
+    for _ in range(5000):
+        dd = dd.level
+    assert isinstance(dd, Dynamic)
+    assert dd.key == 'value'
+
+def test_large_nested_payload():
+    d = {f'group {i}': {f'key {j}': {'value': i * 100 + j} for j in range(100)} for i in range(100)}
+    dd = Dynamic(d)
+    assert len(dd) == 100
+    assert all(isinstance(group, Dynamic) and len(group) == 100 for _, group in dd)
+    assert dd.group_42.key_7.value == 4207
+    assert dd + Dynamic(d) == dd
+
+def test_self_referential_dict():
+    d = {'key1': {}}
+    d['key1']['key2'] = d
+    with pytest.raises(ValueError):
+        Dynamic(d)
+
+def test_self_referential_dict_leaves_target_unchanged():
+    d = {}
+    d['key'] = d
+    dd = Dynamic({'key1': 'value1'})
+    with pytest.raises(ValueError):
+        dd += {'key2': 'value2', 'key3': d}
+    assert dd == {'key1': 'value1'}
+
 def test_init_without_dict():
     dd = Dynamic()
     assert dd == {}
@@ -40,34 +91,49 @@ def test_setattr():
     assert isinstance(dd.subdict, Dynamic)
     assert dd.subdict.subkey == 'subvalue'
 
-def test_setattr_dict_type_error():
-    dd = Dynamic()
-    with pytest.raises(TypeError):
-        dd._dict = 'not a dict'
-
-def test_iadd_with_dict():
-    dd = Dynamic({'key1': 'value1'})
-    dd += {'key2': 'value2'}
+@pytest.mark.parametrize("rhs,inplace", [
+    pytest.param({'key2': 'value2'}, True, id='iadd_with_dict'),
+    pytest.param(Dynamic({'key2': 'value2'}), True, id='iadd_with_attrdict'),
+    pytest.param({'key2': 'value2'}, False, id='add_with_dict'),
+])
+def test_add(dd, rhs, inplace):
+    if inplace:
+        dd += rhs
+    else:
+        dd = dd + rhs
     assert dd.key2 == 'value2'
+    assert dd.key1 == 'value1'
+    assert 'key2' not in _BASE
 
-def test_iadd_with_attrdict():
-    dd1 = Dynamic({'key1': 'value1'})
-    dd2 = Dynamic({'key2': 'value2'})
-    dd1 += dd2
-    assert dd1.key2 == 'value2'
-
-def test_iadd_type_error():
-    dd = Dynamic()
-    with pytest.raises(TypeError):
-        dd += 123
+def test_copy():
+    dd1 = Dynamic({'key1': 'value1', 'key2': {'subkey': 'subvalue'}}, _strict_typing = True)
+    dd2 = copy.copy(dd1)
+    assert dd2 == dd1
+    assert dd2._strict_typing == True
+    assert dd2.key2 is dd1.key2
+    dd2.key3 = 'value3'
+    assert 'key3' not in dd1
 
-def test_add_with_dict():
+def test_add_leaves_original_unchanged():
     dd = Dynamic({'key1': 'value1'})
-    dd = dd + {'key2': 'value2'}
-    assert dd.key2 == 'value2'
+    dd2 = dd + {'key2': 'value2'}
+    assert 'key2' not in dd
+    assert dd2 == {'key1': 'value1', 'key2': 'value2'}
 
-def test_isub_with_dict_strict():
-    dd = Dynamic({'key1': 'value1', 'key2': 'value2'})
+def test_add_with_empty():
+    dd = Dynamic({'key1': 'value1'}, _strict_typing = True)
+    dd2 = dd + {}
+    assert dd2 == dd
+    assert dd2 is not dd
+    assert dd2._strict_typing == True
+    dd3 = Dynamic(_strict_subtraction = False) + dd
+    assert dd3 == dd
+    assert dd3._strict_subtraction == False
+    with pytest.raises(TypeError):
+        _ = Dynamic() + 0
+
+def test_isub_with_dict_strict(mutable_dd):
+    dd = mutable_dd
     dd -= {'key2': 'value2'}
     dd -= {'key1': 'value1b'}
     assert dd.key1 == 'value1'
@@ -78,20 +144,27 @@ def test_isub_with_dict_lax():
     dd -= {'key2': 'value2b'}
     assert 'key2' not in dd
 
-def test_change_strict_subtraction_mode():
-    dd = Dynamic({'key1': 'value1', 'key2': 'value2'})
+def test_change_strict_subtraction_mode(mutable_dd):
+    dd = mutable_dd
     dd._strict_subtraction = False
     dd -= {'key2': 'value2b'}
     assert 'key2' not in dd
 
-def test_isub_with_attrdict():
-    dd1 = Dynamic({'key1': 'value1', 'key2': 'value2'})
+def test_isub_with_attrdict(mutable_dd):
+    dd1 = mutable_dd
     dd2 = Dynamic({'key2': 'value2'})
     dd1 -= dd2
     assert 'key2' not in dd1
 
-def test_sub_with_dict():
-    dd = Dynamic({'key1': 'value1','key2':'value2'})
+def test_isub_with_attrdict_lax():
+    dd1 = Dynamic({'key1': 'value1', 'key2': 'value2'}, _strict_subtraction = False)
+    dd2 = Dynamic({'key2': 'value2b', 'key3': 'value3'})
+    dd1 -= dd2
+    assert 'key2' not in dd1
+    assert dd1.key1 == 'value1'
+
+def test_sub_with_dict(mutable_dd):
+    dd = mutable_dd
     dd = dd - {'key2': 'value2'}
     assert 'key2' not in dd
 
@@ -106,30 +179,41 @@ def test_delattr():
     assert dd.key == 'value'
     del dd.key
     assert 'key' not in dd
+
+@pytest.mark.parametrize("key,prepop", [
+    ('non_existent_key', True),
+    ('_dict', False),
+])
+def test_del_raises(key, prepop):
+    dd = Dynamic({'key': 'value'} if prepop else None)
     with pytest.raises(AttributeError):
-        del dd.non_existent_key
+        delattr(dd, key)
 
-def test_iter():
-    d = {'key1': 'value1', 'key2': 'value2'}
-    dd = Dynamic(d)
-    for key, value in dd:
-        assert d[key] == value
+@pytest.fixture(scope="class")
+def readonly_dd(proto_twokeys):
+    return Dynamic(dict(proto_twokeys))
 
-def test_repr():
-    d = {'key1': 'value1', 'key2': 'value2'}
-    dd = Dynamic(d)
-    assert repr(dd) == repr(d)
+class TestReadOnly:
+    def test_iter(self, readonly_dd, proto_twokeys):
+        assert dict(readonly_dd) == dict(proto_twokeys)
 
-def test_getitem():
-    dd = Dynamic({'key': 'value'})
-    assert dd['key'] == 'value'
-    with pytest.raises(KeyError):
-        _ = dd['non_existent_key']
+    def test_repr(self, readonly_dd, proto_twokeys):
+        assert repr(readonly_dd) == repr(dict(proto_twokeys))
 
-def test_contains():
-    dd = Dynamic({'key': 'value'})
-    assert 'key' in dd
-    assert 'non_existent_key' not in dd
+    def test_getitem(self, readonly_dd):
+        assert readonly_dd['key1'] == 'value1'
+        with pytest.raises(KeyError):
+            _ = readonly_dd['non_existent_key']
+
+    def test_contains(self, readonly_dd):
+        assert 'key1' in readonly_dd
+        assert 'non_existent_key' not in readonly_dd
+
+    def test_len(self, readonly_dd):
+        assert len(readonly_dd) == 2
+
+    def test_str(self, readonly_dd, proto_twokeys):
+        assert str(readonly_dd) == str(dict(proto_twokeys))
 
 def test_contains_for_nested_keys():
     dd = Dynamic({'key1': {'subkey1': 'subvalue1'}})
@@ -145,21 +229,20 @@ def test_eq():
     assert dd1 != {'key': 'different_value'}
     assert dd1 != 123
 
+def test_eq_unsupported_type():
+    class AlwaysEqual:
+        def __eq__(self, other):
+            return True
+    dd = Dynamic({'key': 'value'})
+    assert dd.__eq__(123) is NotImplemented
+    assert dd == AlwaysEqual()
+
 def test_bool():
     dd1 = Dynamic({'key': 'value'})
     dd2 = Dynamic()
     assert bool(dd1)
     assert not bool(dd2)
 
-def test_len():
-    dd = Dynamic({'key1': 'value1', 'key2': 'value2'})
-    assert len(dd) == 2
-
-def test_str():
-    d = {'key1': 'value1', 'key2': 'value2'}
-    dd = Dynamic(d)
-    assert str(dd) == str(d)
-
 def test_func_key():
     d = Dynamic({'key1':'value1'})
     def f():
@@ -175,15 +258,11 @@ def test_mutation():
     s = 'string2'
     assert d.s == 'string1'
 
-def test_use_inspection_disabled():
-    s = 'string1'
-    dd = Dynamic()
-    with pytest.raises(TypeError):
-        dd += s
-
 def test_internal_dict_methods():
     dd = Dynamic({'key1':'value1'})
     assert dd._dict.get('key1') == 'value1'
+    assert dd._dict.pop('key1') == 'value1'
+    assert 'key1' not in dd
 
 def test_initialize_with_dynamic():
     dd = Dynamic({'key1':'value1'})
@@ -194,58 +273,139 @@ def test_namespace_preservation():
     dd = Dynamic()
     dd.keys = lambda: 'Some Keys'
     assert dd.keys() == 'Some Keys'
+    dd.pop = 'Some Pop'
+    assert dd.pop == 'Some Pop'
 
-def test_unsafe_delete():
-    dd = Dynamic()
-    with pytest.raises(AttributeError):
-        del dd._dict
+def test_no_instance_dict():
+    dd = Dynamic({'key':'value'})
+    assert not hasattr(dd, '__dict__')
+    assert dd._dict == {'key':'value'}
+    assert weakref.ref(dd)() is dd
 
 def test_key_renaming():
     dd = Dynamic({'key 1':'value 1'})
     assert dd.key_1 == 'value 1'
 
+def test_key_renaming_flat_merge():
+    dd = Dynamic({'key1':'value1'})
+    dd += {'key 2':'value 2','key3':None}
+    assert dd == {'key1':'value1','key_2':'value 2','key3':None}
+
+def test_key_renaming_nested_merge():
+    dd = Dynamic({'key 1':{'sub key':'value'},'key2':'value 2'})
+    assert list(dd._dict) == ['key_1','key2']
+    assert isinstance(dd.key_1, Dynamic)
+    assert dd.key_1.sub_key == 'value'
+
+def test_str_subclass_keys():
+    class MyStr(str):
+        pass
+    dd = Dynamic()
+    setattr(dd, MyStr('key'), 'value')
+    setattr(dd, MyStr('key 2'), 'value 2')
+    assert dd == {'key': 'value', 'key_2': 'value 2'}
+
 def test_key_renaming_duplicates():
     dd = Dynamic({'key 1':'value 1','key%1':'value 2'})
     assert len(dd) == 1
 
-def test_strict_typing():
-    dd = Dynamic({
+@pytest.fixture(scope="module")
+def strict_template():
+    return Dynamic({
         'number_key': 123,
         'string_key': 'my string',
         'dict_key': {'subkey':'subvalue'},
         'exception_key': TypeError,
     },_strict_typing = True)
+
+def test_strict_typing(strict_template):
+    dd = copy.deepcopy(strict_template)
+    for attr, good_value in [
+        ('number_key', 321),
+        ('string_key', 'another string'),
+        ('dict_key', {'a':'new dict'}),
+        ('exception_key', AttributeError),
+        ('exception_key', None),
+        ('exception_key', AssertionError),
+    ]:
+        setattr(dd, attr, good_value)
+        assert getattr(dd, attr) == good_value
+    assert dd.dict_key.a == 'new dict'
+
+@pytest.mark.parametrize("attr,bad_value", [
+    ('number_key', 'not a number'),
+    ('string_key', 123),
+    ('dict_key', 'not a dict'),
+    ('exception_key', 'not an error'),
+])
+def test_strict_typing_mismatch(strict_template, attr, bad_value):
+    dd = copy.deepcopy(strict_template)
+    with pytest.raises(TypeError):
+        setattr(dd, attr, bad_value)
+
+def test_deepcopy(strict_template):
+    dd = copy.deepcopy(strict_template)
+    assert dd == strict_template
+    assert dd._strict_typing == True
+    assert dd.dict_key is not strict_template.dict_key
+    dd.dict_key.subkey = 'changed'
+    assert strict_template.dict_key.subkey == 'subvalue'
     with pytest.raises(TypeError):
         dd.number_key = 'not a number'
-    dd.number_key = 321
-    assert dd.number_key == 321
+
+def test_enable_strict_typing_later():
+    dd = Dynamic({'number_key': 123, 'dict_key': {'subkey':'subvalue'}})
+    assert dd._dict_types == {}
+    dd._strict_typing = True
     with pytest.raises(TypeError):
-        dd.string_key = 123
-    dd.string_key = 'another string'
-    assert dd.string_key == 'another string'
+        dd.number_key = 'not a number'
     with pytest.raises(TypeError):
         dd.dict_key = 'not a dict'
     dd.dict_key = {'a':'new dict'}
     assert dd.dict_key.a == 'new dict'
+
+def test_strict_typing_iadd_with_attrdict():
+    dd = Dynamic({'number_key': 123}, _strict_typing = True)
+    dd += Dynamic({'number_key': 321, 'string_key': 'my string', 'none_key': None})
+    assert dd.number_key == 321
+    assert dd.none_key == None
     with pytest.raises(TypeError):
-        dd.exception_key = 'not an error'
-    dd.exception_key = AttributeError
-    assert dd.exception_key == AttributeError
-    dd.exception_key = None
-    assert dd.exception_key == None
-    dd.exception_key = AssertionError
-    assert dd.exception_key == AssertionError
-
-def test_add_parameter_preservation():
-    dd = Dynamic({'number_key':123},_strict_typing = True)
+        dd += Dynamic({'string_key': 123})
+    assert dd.string_key == 'my string'
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_iadd_with_directly_assigned_dict(strict):
+    other = Dynamic()
+    other._dict = {'key 1': {'sub': 1}, 'a': {'b': 1}, '_strict_subtraction': False}
+    dd = Dynamic({'a': {'b': 0}}, _strict_typing = strict)
+    dd += other
+    assert dd.key_1.sub == 1
+    assert dd.a.b == 1
+    assert isinstance(dd._dict['a'], Dynamic)
+    assert dd._strict_subtraction == False
+    assert '_strict_subtraction' not in dd
+    dd2 = Dynamic(other)
+    assert isinstance(dd2.key_1, Dynamic)
+    assert dd2._strict_subtraction == False
+
+def test_strict_iadd_with_directly_assigned_nested_dict():
+    other = Dynamic()
+    other._dict = {'a': {'b': 1}}
+    dd = Dynamic({'a': {'b': 0}}, _strict_typing = True)
+    dd += other
+    assert isinstance(dd.a, Dynamic)
+    assert dd.a.b == 1
+
+def test_add_parameter_preservation(strict_template):
+    dd = copy.deepcopy(strict_template)
     dd2 = dd + {'string_key':'some string'}
     assert dd2._strict_typing == True
     dd3 = Dynamic({'string_key':'some string'}) + dd
     assert dd3._strict_typing == False
 
-def test_sub_parameter_preservation():
+def test_sub_parameter_preservation(strict_template):
     d = {'number_key':123}
-    dd = Dynamic(d,_strict_typing = True)
+    dd = copy.deepcopy(strict_template)
     dd2 = dd - d
     assert dd2._strict_typing == True
     dd3 = Dynamic(d) - dd
@@ -278,6 +438,19 @@ def test_protected_attribute_reassignment():
     with pytest.raises(ValueError):
         dd._bind_self = 'Hello World'
 
+def test_merge_reserved_keys():
+    dd = Dynamic()
+    dd += {'key':'value','_strict_typing':True}
+    assert dd._strict_typing == True
+    assert '_strict_typing' not in dd
+    with pytest.raises(ValueError):
+        dd += {'_bind_self':'Hello World'}
+
+def test_helper_names_are_user_keys():
+    dd = Dynamic({'_merge_items': 1, '_shallow_copy': 2})
+    dd._from_dict = 3
+    assert dd == {'_merge_items': 1, '_shallow_copy': 2, '_from_dict': 3}
+
 def test_callable_with_non_bound_self():
     dd = Dynamic()
     def f(var, self):